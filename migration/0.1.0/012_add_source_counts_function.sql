@@ -0,0 +1,52 @@
+-- =====================================================
+-- Migration 012: Add batched source counts function
+-- =====================================================
+-- This migration adds archon_get_source_counts(), which returns
+-- the crawled page (document) count and code example count for a
+-- list of sources in a single call.
+--
+-- Issue: The knowledge list/summary endpoints issued two COUNT
+-- queries per source on the page (2N round-trips per request)
+-- Solution: Aggregate the counts in the database and return them
+-- for the whole page of sources in one RPC. Callers that only need
+-- code example counts pass include_document_counts => false to skip
+-- counting crawled pages
+-- =====================================================
+
+-- Replace any earlier single-argument version rather than adding an overload
+DROP FUNCTION IF EXISTS archon_get_source_counts(TEXT[]);
+
+CREATE OR REPLACE FUNCTION archon_get_source_counts(
+    source_ids TEXT[],
+    include_document_counts BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (
+    source_id TEXT,
+    document_count BIGINT,
+    code_example_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        ids.source_id,
+        CASE
+            WHEN include_document_counts
+            THEN (SELECT COUNT(*) FROM archon_crawled_pages cp WHERE cp.source_id = ids.source_id)
+            ELSE 0
+        END AS document_count,
+        (SELECT COUNT(*) FROM archon_code_examples ce WHERE ce.source_id = ids.source_id) AS code_example_count
+    FROM unnest(source_ids) AS ids(source_id);
+$$;
+
+COMMENT ON FUNCTION archon_get_source_counts IS
+    'Returns document (crawled page) and code example counts for each source_id in a single call';
+
+-- Record the migration
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '012_add_source_counts_function')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
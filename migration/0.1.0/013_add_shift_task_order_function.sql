@@ -0,0 +1,46 @@
+-- =====================================================
+-- Migration 013: Add task order shift function
+-- =====================================================
+-- This migration adds archon_shift_task_order(), which makes room
+-- for a new task by incrementing task_order on every task in the
+-- same project and status column at or after a given position.
+--
+-- Issue: Creating a task at a position issued one UPDATE per task
+-- that had to move down (N round-trips per insert)
+-- Solution: Shift the whole column with a single UPDATE in the
+-- database and return how many tasks were moved
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION archon_shift_task_order(
+    project_id_param UUID,
+    status_param TEXT,
+    from_order_param INTEGER
+)
+RETURNS INTEGER AS $$
+DECLARE
+    shifted_count INTEGER;
+BEGIN
+    UPDATE archon_tasks
+    SET
+        task_order = task_order + 1,
+        updated_at = NOW()
+    WHERE project_id = project_id_param
+      AND status = status_param::task_status
+      AND task_order >= from_order_param;
+
+    GET DIAGNOSTICS shifted_count = ROW_COUNT;
+    RETURN shifted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION archon_shift_task_order IS
+    'Increments task_order for tasks in a project/status at or after from_order_param; returns the number of tasks shifted';
+
+-- Record the migration
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '013_add_shift_task_order_function')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -140,13 +140,17 @@ BEGIN
     -- Hybrid search functions (with ts_vector support)
     DROP FUNCTION IF EXISTS hybrid_search_archon_crawled_pages(vector, text, int, jsonb, text) CASCADE;
     DROP FUNCTION IF EXISTS hybrid_search_archon_code_examples(vector, text, int, jsonb, text) CASCADE;
-    
+
+    -- Knowledge base aggregate functions
+    DROP FUNCTION IF EXISTS archon_get_source_counts(text[], boolean) CASCADE;
+
     -- Search functions (old without prefix)
     DROP FUNCTION IF EXISTS match_crawled_pages(vector, int, jsonb, text) CASCADE;
     DROP FUNCTION IF EXISTS match_code_examples(vector, int, jsonb, text) CASCADE;
     
     -- Task management functions
     DROP FUNCTION IF EXISTS archive_task(UUID, TEXT) CASCADE;
+    DROP FUNCTION IF EXISTS archon_shift_task_order(UUID, TEXT, INTEGER) CASCADE;
     
     RAISE NOTICE 'Functions dropped successfully.';
     
@@ -817,6 +817,36 @@ COMMENT ON FUNCTION hybrid_search_archon_crawled_pages IS 'Legacy hybrid search
 COMMENT ON FUNCTION hybrid_search_archon_code_examples_multi IS 'Multi-dimensional hybrid search on code examples with configurable embedding dimensions';
 COMMENT ON FUNCTION hybrid_search_archon_code_examples IS 'Legacy hybrid search function for code examples (uses 1536D embeddings)';
 
+-- =====================================================
+-- SECTION 5C: KNOWLEDGE BASE AGGREGATE FUNCTIONS
+-- =====================================================
+
+-- Batched per-source counts so list endpoints avoid one COUNT query per source
+CREATE OR REPLACE FUNCTION archon_get_source_counts(
+    source_ids TEXT[],
+    include_document_counts BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (
+    source_id TEXT,
+    document_count BIGINT,
+    code_example_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        ids.source_id,
+        CASE
+            WHEN include_document_counts
+            THEN (SELECT COUNT(*) FROM archon_crawled_pages cp WHERE cp.source_id = ids.source_id)
+            ELSE 0
+        END AS document_count,
+        (SELECT COUNT(*) FROM archon_code_examples ce WHERE ce.source_id = ids.source_id) AS code_example_count
+    FROM unnest(source_ids) AS ids(source_id);
+$$;
+
+COMMENT ON FUNCTION archon_get_source_counts IS 'Returns document (crawled page) and code example counts for each source_id in a single call';
+
 -- =====================================================
 -- SECTION 6: RLS POLICIES FOR KNOWLEDGE BASE
 -- =====================================================
@@ -1008,6 +1038,29 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Shift task_order down one slot for tasks at or after a position (used when inserting a task)
+CREATE OR REPLACE FUNCTION archon_shift_task_order(
+    project_id_param UUID,
+    status_param TEXT,
+    from_order_param INTEGER
+)
+RETURNS INTEGER AS $$
+DECLARE
+    shifted_count INTEGER;
+BEGIN
+    UPDATE archon_tasks
+    SET
+        task_order = task_order + 1,
+        updated_at = NOW()
+    WHERE project_id = project_id_param
+      AND status = status_param::task_status
+      AND task_order >= from_order_param;
+
+    GET DIAGNOSTICS shifted_count = ROW_COUNT;
+    RETURN shifted_count;
+END;
+$$ LANGUAGE plpgsql;
+
 -- Add comments to document the soft delete fields
 COMMENT ON COLUMN archon_tasks.assignee IS 'The agent or user assigned to this task. Can be any valid agent name or "User"';
 COMMENT ON COLUMN archon_tasks.priority IS 'Task priority level independent of visual ordering - used for semantic importance (low, medium, high, critical)';
@@ -1062,7 +1115,9 @@ VALUES
   ('0.1.0', '008_add_migration_tracking'),
   ('0.1.0', '009_add_cascade_delete_constraints'),
   ('0.1.0', '010_add_provider_placeholders'),
-  ('0.1.0', '011_add_page_metadata_table')
+  ('0.1.0', '011_add_page_metadata_table'),
+  ('0.1.0', '012_add_source_counts_function'),
+  ('0.1.0', '013_add_shift_task_order_function')
 ON CONFLICT (version, migration_name) DO NOTHING;
 
 -- Enable Row Level Security on migrations table
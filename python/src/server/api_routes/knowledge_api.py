@@ -623,21 +623,20 @@ async def refresh_knowledge_item(source_id: str):
     try:
         safe_logfire_info(f"Starting knowledge item refresh | source_id={source_id}")
 
-        # Get the existing knowledge item
+        # Get only what the re-crawl needs (not the full item with code examples)
         service = KnowledgeItemService(get_supabase_client())
-        existing_item = await service.get_item(source_id)
+        crawl_config = await service.get_item_crawl_config(source_id)
 
-        if not existing_item:
+        if not crawl_config:
             raise HTTPException(
                 status_code=404, detail={"error": f"Knowledge item {source_id} not found"}
             )
 
         # Extract metadata
-        metadata = existing_item.get("metadata", {})
+        metadata = crawl_config["metadata"]
 
-        # Extract the URL from the existing item
-        # First try to get the original URL from metadata, fallback to url field
-        url = metadata.get("original_url") or existing_item.get("url")
+        # Original URL from metadata, falling back to the first crawled page URL
+        url = crawl_config["url"]
         if not url:
             raise HTTPException(
                 status_code=400, detail={"error": "Knowledge item does not have a URL to refresh"}
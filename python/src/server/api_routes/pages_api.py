@@ -7,8 +7,8 @@ This module handles page retrieval operations for RAG:
 - Get page by URL
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
 
 from ..config.logfire_config import get_logger, safe_logfire_error
 from ..utils import get_supabase_client
@@ -35,18 +35,11 @@ class PageSummary(BaseModel):
     chunk_count: int
 
 
-class PageResponse(BaseModel):
-    """Response model for a single page (with content)"""
+class PageResponse(PageSummary):
+    """Response model for a single page (summary fields plus content)"""
 
-    id: str
     source_id: str
-    url: str
     full_content: str
-    section_title: str | None = None
-    section_order: int = 0
-    word_count: int
-    char_count: int
-    chunk_count: int
     metadata: dict
     created_at: str
     updated_at: str
@@ -60,6 +53,21 @@ class PageListResponse(BaseModel):
     source_id: str
 
 
+# Built once so list_pages reuses the compiled validator instead of constructing
+# PageSummary row by row
+_PAGE_SUMMARIES_ADAPTER = TypeAdapter(list[PageSummary])
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with pydantic-core's JSON encoder.
+
+    Returning the model directly makes FastAPI convert it to Python objects with
+    jsonable_encoder and then json.dumps them; model_dump_json skips that round trip.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 def _handle_large_page_content(page_data: dict) -> dict:
     """
     Replace full_content with a helpful message if page is too large for LLM context.
@@ -123,9 +131,9 @@ async def list_pages(
         result = query.execute()
 
         # Use PageSummary (no content handling needed)
-        pages = [PageSummary(**page) for page in result.data]
+        pages = _PAGE_SUMMARIES_ADAPTER.validate_python(result.data)
 
-        return PageListResponse(pages=pages, total=len(pages), source_id=source_id)
+        return _json_response(PageListResponse(pages=pages, total=len(pages), source_id=source_id))
 
     except Exception as e:
         logger.error(f"Error listing pages for source {source_id}: {e}", exc_info=True)
@@ -157,7 +165,7 @@ async def get_page_by_url(url: str = Query(..., description="The URL of the page
 
         # Handle large pages
         page_data = _handle_large_page_content(result.data.copy())
-        return PageResponse(**page_data)
+        return _json_response(PageResponse(**page_data))
 
     except HTTPException:
         raise
@@ -189,7 +197,7 @@ async def get_page_by_id(page_id: str):
 
         # Handle large pages
         page_data = _handle_large_page_content(result.data.copy())
-        return PageResponse(**page_data)
+        return _json_response(PageResponse(**page_data))
 
     except HTTPException:
         raise
@@ -9,9 +9,18 @@ import re
 
 from pydantic import BaseModel
 
+# Slug cleanup patterns, compiled once since they run for every H1 section
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9-]")
+_SLUG_REPEATED_HYPHENS = re.compile(r"-+")
+
 
 class LLMsFullSection(BaseModel):
-    """Parsed section from llms-full.txt file"""
+    """
+    Parsed section from llms-full.txt file.
+
+    The parser builds these with model_construct: every field is computed locally
+    with the right type, so per-section validation is skipped.
+    """
 
     section_title: str  # Raw H1 text: "# Core Concepts"
     section_order: int  # Position in document: 0, 1, 2, ...
@@ -45,10 +54,10 @@ def create_section_slug(h1_heading: str) -> str:
     slug = slug.replace(" ", "-")
 
     # Remove special characters (keep only alphanumeric and hyphens)
-    slug = re.sub(r"[^a-z0-9-]", "", slug)
+    slug = _SLUG_INVALID_CHARS.sub("", slug)
 
     # Remove consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_REPEATED_HYPHENS.sub("-", slug)
 
     # Remove leading/trailing hyphens
     slug = slug.strip("-")
@@ -149,7 +158,7 @@ def parse_llms_full_sections(content: str, base_url: str) -> list[LLMsFullSectio
                     word_count = len(section_text.split())
 
                     sections.append(
-                        LLMsFullSection(
+                        LLMsFullSection.model_construct(
                             section_title=current_h1,
                             section_order=section_order,
                             content=section_text,
@@ -174,7 +183,7 @@ def parse_llms_full_sections(content: str, base_url: str) -> list[LLMsFullSectio
             section_url = create_section_url(base_url, current_h1, section_order)
             word_count = len(section_text.split())
             sections.append(
-                LLMsFullSection(
+                LLMsFullSection.model_construct(
                     section_title=current_h1,
                     section_order=section_order,
                     content=section_text,
@@ -186,7 +195,7 @@ def parse_llms_full_sections(content: str, base_url: str) -> list[LLMsFullSectio
     # Edge case: No H1 headers found, treat entire file as single page
     if not sections and content.strip():
         sections.append(
-            LLMsFullSection(
+            LLMsFullSection.model_construct(
                 section_title="Full Document",
                 section_order=0,
                 content=content,
@@ -214,7 +223,7 @@ def parse_llms_full_sections(content: str, base_url: str) -> list[LLMsFullSectio
                 # Combine content
                 combined_content = current.content + "\n\n" + next_section.content
                 # Update current with combined content
-                current = LLMsFullSection(
+                current = LLMsFullSection.model_construct(
                     section_title=current.section_title,
                     section_order=current.section_order,
                     content=combined_content,
@@ -247,7 +256,7 @@ def parse_llms_full_sections(content: str, base_url: str) -> list[LLMsFullSectio
                 combined_content = combined_content + "\n\n" + sections[i].content
 
             # Create combined section with first section's metadata
-            combined = LLMsFullSection(
+            combined = LLMsFullSection.model_construct(
                 section_title=current.section_title,
                 section_order=current.section_order,
                 content=combined_content,
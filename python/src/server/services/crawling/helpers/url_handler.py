@@ -13,6 +13,23 @@ from ....config.logfire_config import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns are compiled once at import since they run for every crawled page or file.
+# Ultimate URL pattern with comprehensive format support:
+#  1) [text](url) - markdown links
+#  2) <https://...> - autolinks
+#  3) https://... - bare URLs with protocol
+#  4) //example.com - protocol-relative URLs
+#  5) www.example.com - scheme-less www URLs
+_LINK_PATTERN = re.compile(
+    r'\[(?P<text>[^\]]*)\]\((?P<md>[^)]+)\)'      # named: md
+    r'|<\s*(?P<auto>https?://[^>\s]+)\s*>'        # named: auto
+    r'|(?P<bare>https?://[^\s<>()\[\]"]+)'        # named: bare
+    r'|(?P<proto>//[^\s<>()\[\]"]+)'              # named: protocol-relative
+    r'|(?P<www>www\.[^\s<>()\[\]"]+)'             # named: www.* without scheme
+)
+# "full" as a standalone filename token (avoids false positives like "helpful.md")
+_FULL_TOKEN_PATTERN = re.compile(r'(^|[._-])full([._-]|$)')
+
 
 class URLHandler:
     """Helper class for URL operations."""
@@ -310,20 +327,6 @@ class URLHandler:
             if not content:
                 return []
 
-            # Ultimate URL pattern with comprehensive format support:
-            #  1) [text](url) - markdown links
-            #  2) <https://...> - autolinks
-            #  3) https://... - bare URLs with protocol
-            #  4) //example.com - protocol-relative URLs
-            #  5) www.example.com - scheme-less www URLs
-            combined_pattern = re.compile(
-                r'\[(?P<text>[^\]]*)\]\((?P<md>[^)]+)\)'      # named: md
-                r'|<\s*(?P<auto>https?://[^>\s]+)\s*>'        # named: auto
-                r'|(?P<bare>https?://[^\s<>()\[\]"]+)'        # named: bare
-                r'|(?P<proto>//[^\s<>()\[\]"]+)'              # named: protocol-relative
-                r'|(?P<www>www\.[^\s<>()\[\]"]+)'             # named: www.* without scheme
-            )
-
             def _clean_url(u: str) -> str:
                 # Trim whitespace and comprehensive trailing punctuation
                 # Also remove invisible Unicode characters that can break URLs
@@ -334,7 +337,7 @@ class URLHandler:
                 return cleaned
 
             links = []
-            for match in re.finditer(combined_pattern, content):
+            for match in _LINK_PATTERN.finditer(content):
                 url = (
                     match.group('md')
                     or match.group('auto')
@@ -420,8 +423,7 @@ class URLHandler:
             # Only match files that are likely link collections, not complete content files
             if filename.endswith('.txt'):
                 # Exclude files with "full" as standalone token (avoid false positives like "helpful.md")
-                import re
-                if not re.search(r'(^|[._-])full([._-]|$)', filename):
+                if not _FULL_TOKEN_PATTERN.search(filename):
                     # Match files that start with common link collection prefixes
                     base_patterns = ['llms', 'links', 'resources', 'references']
                     if any(filename.startswith(pattern + '.') or filename.startswith(pattern + '-') for pattern in base_patterns):
@@ -431,8 +433,7 @@ class URLHandler:
             # Content-based detection if content is provided
             if content:
                 # Never treat "full" variants as link collections to preserve single-page behavior
-                import re
-                if re.search(r'(^|[._-])full([._-]|$)', filename):
+                if _FULL_TOKEN_PATTERN.search(filename):
                     logger.info(f"Skipping content-based link-collection detection for full-content file: {filename}")
                     return False
                 # Reuse extractor to avoid regex divergence and maintain consistency
@@ -7,6 +7,7 @@ Handles all knowledge item CRUD operations and data transformations.
 from typing import Any
 
 from ...config.logfire_config import safe_logfire_error, safe_logfire_info
+from .source_counts import get_source_counts
 
 
 class KnowledgeItemService:
@@ -96,37 +97,27 @@ class KnowledgeItemService:
             chunk_counts = {}
 
             if source_ids:
-                # Batch fetch first URLs
-                urls_result = (
-                    self.supabase.from_("archon_crawled_pages")
-                    .select("source_id, url")
-                    .in_("source_id", source_ids)
-                    .execute()
-                )
-
-                # Group URLs by source_id (take first one for each)
-                for item in urls_result.data or []:
-                    if item["source_id"] not in first_urls:
-                        first_urls[item["source_id"]] = item["url"]
-
-                # Get code example counts per source - NO CONTENT, just counts!
-                # Fetch counts individually for each source
-                for source_id in source_ids:
-                    count_result = (
-                        self.supabase.from_("archon_code_examples")
-                        .select("id", count="exact", head=True)
-                        .eq("source_id", source_id)
+                # Batch fetch first URLs, only for sources without a stored source_url -
+                # this reads crawled page rows, so skip it when every source has one
+                missing_url_ids = [s["source_id"] for s in sources if not s.get("source_url")]
+                if missing_url_ids:
+                    urls_result = (
+                        self.supabase.from_("archon_crawled_pages")
+                        .select("source_id, url")
+                        .in_("source_id", missing_url_ids)
                         .execute()
                     )
-                    code_example_counts[source_id] = (
-                        count_result.count if hasattr(count_result, "count") else 0
-                    )
 
-                # Ensure all sources have a count (default to 0)
-                for source_id in source_ids:
-                    if source_id not in code_example_counts:
-                        code_example_counts[source_id] = 0
-                    chunk_counts[source_id] = 0  # Default to 0 to avoid timeout
+                    # Group URLs by source_id (take first one for each)
+                    for item in urls_result.data or []:
+                        if item["source_id"] not in first_urls:
+                            first_urls[item["source_id"]] = item["url"]
+
+                # Get code example counts for every source in one RPC - NO CONTENT, just counts!
+                # Chunk counts stay at 0 to avoid timeout counting crawled pages
+                chunk_counts, code_example_counts = get_source_counts(
+                    self.supabase, source_ids, include_documents=False
+                )
 
                 safe_logfire_info(f"Code example counts: {code_example_counts}")
 
@@ -199,23 +190,23 @@ class KnowledgeItemService:
             safe_logfire_error(f"Failed to list knowledge items | error={str(e)}")
             raise
 
-    async def get_item(self, source_id: str) -> dict[str, Any] | None:
+    async def get_item_crawl_config(self, source_id: str) -> dict[str, Any] | None:
         """
-        Get a single knowledge item by source ID.
+        Get the URL and metadata needed to re-crawl a knowledge item.
+
+        Reads only the source metadata and, when no original URL was recorded, the
+        first crawled page URL - no code examples or chunk count.
 
         Args:
-            source_id: The source ID to retrieve
+            source_id: The source ID to look up
 
         Returns:
-            Knowledge item dict or None if not found
+            Dict with "url" and "metadata", or None if not found
         """
         try:
-            safe_logfire_info(f"Getting knowledge item | source_id={source_id}")
-
-            # Get the source record
             result = (
                 self.supabase.from_("archon_sources")
-                .select("*")
+                .select("metadata")
                 .eq("source_id", source_id)
                 .single()
                 .execute()
@@ -224,13 +215,13 @@ class KnowledgeItemService:
             if not result.data:
                 return None
 
-            # Transform the source to item format
-            item = await self._transform_source_to_item(result.data)
-            return item
+            metadata = result.data.get("metadata") or {}
+            url = metadata.get("original_url") or await self._get_first_page_url(source_id)
+            return {"url": url, "metadata": metadata}
 
         except Exception as e:
             safe_logfire_error(
-                f"Failed to get knowledge item | error={str(e)} | source_id={source_id}"
+                f"Failed to get knowledge item crawl config | error={str(e)} | source_id={source_id}"
             )
             return None
 
@@ -347,58 +338,6 @@ class KnowledgeItemService:
         result = await self.get_available_sources()
         return result.get("sources", [])
 
-    async def _transform_source_to_item(self, source: dict[str, Any]) -> dict[str, Any]:
-        """
-        Transform a source record into a knowledge item with enriched data.
-
-        Args:
-            source: The source record from database
-
-        Returns:
-            Transformed knowledge item
-        """
-        source_metadata = source.get("metadata", {})
-        source_id = source["source_id"]
-
-        # Get first page URL
-        first_page_url = await self._get_first_page_url(source_id)
-
-        # Determine source type
-        source_type = self._determine_source_type(source_metadata, first_page_url)
-
-        # Get code examples
-        code_examples = await self._get_code_examples(source_id)
-
-        return {
-            "id": source_id,
-            "title": source.get("title", source.get("summary", "Untitled")),
-            "url": first_page_url,
-            "source_id": source_id,
-            "code_examples": code_examples,
-            "metadata": {
-                # Spread source_metadata first, then override with computed values
-                **source_metadata,
-                "knowledge_type": source_metadata.get("knowledge_type", "technical"),
-                "tags": source_metadata.get("tags", []),
-                "source_type": source_type,  # This should be the correctly determined source_type
-                "status": "active",
-                "description": source_metadata.get("description", source.get("summary", "")),
-                "chunks_count": await self._get_chunks_count(source_id),  # Get actual chunk count
-                "word_count": source.get("total_words", 0),
-                "estimated_pages": round(
-                    source.get("total_words", 0) / 250, 1
-                ),  # Average book page = 250 words
-                "pages_tooltip": f"{round(source.get('total_words', 0) / 250, 1)} pages (≈ {source.get('total_words', 0):,} words)",
-                "last_scraped": source.get("updated_at"),
-                "file_name": source_metadata.get("file_name"),
-                "file_type": source_metadata.get("file_type"),
-                "update_frequency": source.get("update_frequency", 7),
-                "code_examples_count": len(code_examples),
-            },
-            "created_at": source.get("created_at"),
-            "updated_at": source.get("updated_at"),
-        }
-
     async def _get_first_page_url(self, source_id: str) -> str:
         """Get the first page URL for a source."""
         try:
@@ -418,21 +357,6 @@ class KnowledgeItemService:
 
         return f"source://{source_id}"
 
-    async def _get_code_examples(self, source_id: str) -> list[dict[str, Any]]:
-        """Get code examples for a source."""
-        try:
-            code_examples_response = (
-                self.supabase.from_("archon_code_examples")
-                .select("id, content, summary, metadata")
-                .eq("source_id", source_id)
-                .execute()
-            )
-
-            return code_examples_response.data if code_examples_response.data else []
-
-        except Exception:
-            return []
-
     def _determine_source_type(self, metadata: dict[str, Any], url: str) -> str:
         """Determine the source type from metadata or URL pattern."""
         stored_source_type = metadata.get("source_type")
@@ -458,22 +382,3 @@ class KnowledgeItemService:
     ) -> list[dict[str, Any]]:
         """Filter items by knowledge type."""
         return [item for item in items if item["metadata"].get("knowledge_type") == knowledge_type]
-
-    async def _get_chunks_count(self, source_id: str) -> int:
-        """Get the actual number of chunks for a source."""
-        try:
-            # Count the actual rows in crawled_pages for this source
-            result = (
-                self.supabase.table("archon_crawled_pages")
-                .select("*", count="exact")
-                .eq("source_id", source_id)
-                .execute()
-            )
-
-            # Return the count of pages (chunks)
-            return result.count if result.count else 0
-
-        except Exception as e:
-            # If we can't get chunk count, return 0
-            safe_logfire_info(f"Failed to get chunk count for {source_id}: {e}")
-            return 0
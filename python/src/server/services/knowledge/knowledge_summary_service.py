@@ -8,6 +8,7 @@ Optimized for frequent polling and card displays.
 from typing import Any, Optional
 
 from ...config.logfire_config import safe_logfire_info, safe_logfire_error
+from .source_counts import get_source_counts
 
 
 class KnowledgeSummaryService:
@@ -100,14 +101,15 @@ class KnowledgeSummaryService:
             summaries = []
             
             if source_ids:
-                # Get document counts in a single query
-                doc_counts = await self._get_document_counts_batch(source_ids)
+                # Get document and code example counts in a single RPC call
+                doc_counts, code_counts = get_source_counts(self.supabase, source_ids)
                 
-                # Get code example counts in a single query
-                code_counts = await self._get_code_example_counts_batch(source_ids)
-                
-                # Get first URLs in a single query
-                first_urls = await self._get_first_urls_batch(source_ids)
+                # Get first URLs in a single query, only for sources without a stored
+                # source_url - this scans crawled pages, so skip it when it isn't needed
+                missing_url_ids = [s["source_id"] for s in sources if not s.get("source_url")]
+                first_urls = (
+                    await self._get_first_urls_batch(missing_url_ids) if missing_url_ids else {}
+                )
                 
                 # Build summaries
                 for source in sources:
@@ -163,67 +165,7 @@ class KnowledgeSummaryService:
         except Exception as e:
             safe_logfire_error(f"Failed to get knowledge summaries | error={str(e)}")
             raise
-    
-    async def _get_document_counts_batch(self, source_ids: list[str]) -> dict[str, int]:
-        """
-        Get document counts for multiple sources in a single query.
-        
-        Args:
-            source_ids: List of source IDs
-            
-        Returns:
-            Dict mapping source_id to document count
-        """
-        try:
-            # Use a raw SQL query for efficient counting
-            # Group by source_id and count
-            counts = {}
-            
-            # For now, use individual queries but optimize later with raw SQL
-            for source_id in source_ids:
-                result = (
-                    self.supabase.from_("archon_crawled_pages")
-                    .select("id", count="exact", head=True)
-                    .eq("source_id", source_id)
-                    .execute()
-                )
-                counts[source_id] = result.count if hasattr(result, "count") else 0
-            
-            return counts
-            
-        except Exception as e:
-            safe_logfire_error(f"Failed to get document counts | error={str(e)}")
-            return {sid: 0 for sid in source_ids}
-    
-    async def _get_code_example_counts_batch(self, source_ids: list[str]) -> dict[str, int]:
-        """
-        Get code example counts for multiple sources efficiently.
-        
-        Args:
-            source_ids: List of source IDs
-            
-        Returns:
-            Dict mapping source_id to code example count
-        """
-        try:
-            counts = {}
-            
-            # For now, use individual queries but can optimize with raw SQL later
-            for source_id in source_ids:
-                result = (
-                    self.supabase.from_("archon_code_examples")
-                    .select("id", count="exact", head=True)
-                    .eq("source_id", source_id)
-                    .execute()
-                )
-                counts[source_id] = result.count if hasattr(result, "count") else 0
-            
-            return counts
-            
-        except Exception as e:
-            safe_logfire_error(f"Failed to get code example counts | error={str(e)}")
-            return {sid: 0 for sid in source_ids}
-    
+
     async def _get_first_urls_batch(self, source_ids: list[str]) -> dict[str, str]:
         """
         Get first URL for each source in a batch.
@@ -0,0 +1,71 @@
+"""
+Source Counts
+
+Batched document and code example counts for knowledge sources, shared by the
+knowledge list and summary services.
+"""
+
+from ...config.logfire_config import safe_logfire_error
+
+
+def get_source_counts(
+    supabase, source_ids: list[str], include_documents: bool = True
+) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    Get document and code example counts for multiple sources.
+
+    Uses the archon_get_source_counts RPC (migration 012) so the database does
+    the aggregation in one call. Falls back to one COUNT query per source when
+    the RPC is unavailable, so counts stay correct on databases without it.
+
+    Args:
+        supabase: The Supabase client
+        source_ids: List of source IDs
+        include_documents: Whether to count crawled pages; when False document
+            counts are all 0 and archon_crawled_pages is not scanned
+
+    Returns:
+        Tuple of (document counts, code example counts), each mapping source_id to count
+    """
+    doc_counts = dict.fromkeys(source_ids, 0)
+    code_counts = dict.fromkeys(source_ids, 0)
+
+    try:
+        result = supabase.rpc(
+            "archon_get_source_counts",
+            {"source_ids": source_ids, "include_document_counts": include_documents},
+        ).execute()
+    except Exception as e:
+        safe_logfire_error(
+            f"Source counts RPC failed, falling back to per-source counts | error={str(e)}"
+        )
+        if include_documents:
+            doc_counts = _count_per_source(supabase, "archon_crawled_pages", source_ids)
+        code_counts = _count_per_source(supabase, "archon_code_examples", source_ids)
+        return doc_counts, code_counts
+
+    for row in result.data or []:
+        source_id = row["source_id"]
+        doc_counts[source_id] = row.get("document_count") or 0
+        code_counts[source_id] = row.get("code_example_count") or 0
+
+    return doc_counts, code_counts
+
+
+def _count_per_source(supabase, table: str, source_ids: list[str]) -> dict[str, int]:
+    """Count a table's rows for each source with one head-only COUNT query per source."""
+    try:
+        counts = {}
+        for source_id in source_ids:
+            result = (
+                supabase.from_(table)
+                .select("id", count="exact", head=True)
+                .eq("source_id", source_id)
+                .execute()
+            )
+            counts[source_id] = result.count if hasattr(result, "count") else 0
+        return counts
+
+    except Exception as e:
+        safe_logfire_error(f"Failed to count {table} rows | error={str(e)}")
+        return dict.fromkeys(source_ids, 0)
@@ -49,6 +49,9 @@ class MigrationService:
             self._migrations_dir = Path("/app/migration")
         else:
             self._migrations_dir = Path("migration")
+        # Parsed migration files keyed by path; an entry is reused while the file's
+        # (mtime, size) is unchanged, so status polls skip re-reading and re-hashing
+        self._scan_cache: dict[Path, tuple[tuple[int, int], PendingMigration]] = {}
 
     def _get_supabase_client(self) -> Client:
         """Get or create Supabase client."""
@@ -126,9 +129,11 @@ class MigrationService:
             List of PendingMigration objects
         """
         migrations = []
+        scanned: dict[Path, tuple[tuple[int, int], PendingMigration]] = {}
 
         if not self._migrations_dir.exists():
             logfire.warning(f"Migration directory does not exist: {self._migrations_dir}")
+            self._scan_cache = scanned
             return migrations
 
         # Scan all version directories
@@ -141,6 +146,15 @@ class MigrationService:
             # Scan all SQL files in version directory
             for sql_file in sorted(version_dir.glob("*.sql")):
                 try:
+                    # Reuse the parsed migration if the file hasn't changed since last scan
+                    stat = sql_file.stat()
+                    file_key = (stat.st_mtime_ns, stat.st_size)
+                    cached = self._scan_cache.get(sql_file)
+                    if cached and cached[0] == file_key:
+                        scanned[sql_file] = cached
+                        migrations.append(cached[1])
+                        continue
+
                     # Read SQL content
                     with open(sql_file, encoding="utf-8") as f:
                         sql_content = f.read()
@@ -155,10 +169,13 @@ class MigrationService:
                         sql_content=sql_content,
                         file_path=str(sql_file.relative_to(Path.cwd())),
                     )
+                    scanned[sql_file] = (file_key, migration)
                     migrations.append(migration)
                 except Exception as e:
                     logfire.error(f"Error reading migration file {sql_file}: {e}")
 
+        # Replace rather than update so deleted files drop out of the cache
+        self._scan_cache = scanned
         return migrations
 
     async def get_pending_migrations(self) -> list[PendingMigration]:
@@ -244,6 +244,7 @@ class DocumentService:
             docs = current_docs.copy()
 
             # Find and update the document
+            now = datetime.now().isoformat()
             updated = False
             for i, doc in enumerate(docs):
                 if doc.get("id") == doc_id:
@@ -261,7 +262,7 @@ class DocumentService:
                     if "version" in update_fields:
                         docs[i]["version"] = update_fields["version"]
 
-                    docs[i]["updated_at"] = datetime.now().isoformat()
+                    docs[i]["updated_at"] = now
                     updated = True
                     break
 
@@ -273,7 +274,7 @@ class DocumentService:
             # Update the project
             response = (
                 self.supabase_client.table("archon_projects")
-                .update({"docs": docs, "updated_at": datetime.now().isoformat()})
+                .update({"docs": docs, "updated_at": now})
                 .eq("id", project_id)
                 .execute()
             )
@@ -51,12 +51,13 @@ class ProjectCreationService:
             # Database setup step
 
             # Create basic project structure
+            now = datetime.now(UTC).isoformat()
             project_data = {
                 "title": title,
                 "description": description or "",
                 "github_repo": github_repo,
-                "created_at": datetime.now(UTC).isoformat(),
-                "updated_at": datetime.now(UTC).isoformat(),
+                "created_at": now,
+                "updated_at": now,
                 "docs": [],  # Empty docs array to start - PRD will be added here by DocumentAgent
                 "features": kwargs.get("features", {}),
                 "data": kwargs.get("data", {}),
@@ -37,13 +37,14 @@ class ProjectService:
                 return False, {"error": "Project title is required and must be a non-empty string"}
 
             # Create project data
+            now = datetime.now().isoformat()
             project_data = {
                 "title": title.strip(),
                 "docs": [],  # Will add PRD document after creation
                 "features": [],
                 "data": [],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now,
+                "updated_at": now,
             }
 
             if github_repo and isinstance(github_repo, str) and len(github_repo.strip()) > 0:
@@ -232,24 +233,19 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            # First, check if project exists
+            # Check the project exists and count its tasks for reporting in one query,
+            # using an embedded aggregate instead of fetching every task id
             check_response = (
                 self.supabase_client.table("archon_projects")
-                .select("id")
+                .select("id, archon_tasks(count)")
                 .eq("id", project_id)
                 .execute()
             )
             if not check_response.data:
                 return False, {"error": f"Project with ID {project_id} not found"}
 
-            # Get task count for reporting
-            tasks_response = (
-                self.supabase_client.table("archon_tasks")
-                .select("id")
-                .eq("project_id", project_id)
-                .execute()
-            )
-            tasks_count = len(tasks_response.data) if tasks_response.data else 0
+            task_aggregate = check_response.data[0].get("archon_tasks") or [{}]
+            tasks_count = task_aggregate[0].get("count", 0)
 
             # Delete the project (tasks will be deleted by cascade)
             response = (
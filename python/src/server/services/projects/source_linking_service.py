@@ -58,6 +58,44 @@ class SourceLinkingService:
                 "business_sources": [],
             }
 
+    def get_sources_for_projects(
+        self, project_ids: list[str]
+    ) -> tuple[bool, dict[str, dict[str, list[str]]]]:
+        """
+        Get linked sources for many projects in a single query, separated by type.
+
+        Returns:
+            Tuple of (success, {project_id: {"technical_sources": [...], "business_sources": [...]}})
+        """
+        sources_by_project: dict[str, dict[str, list[str]]] = {
+            project_id: {"technical_sources": [], "business_sources": []}
+            for project_id in project_ids
+        }
+        if not project_ids:
+            return True, sources_by_project
+
+        try:
+            response = (
+                self.supabase_client.table("archon_project_sources")
+                .select("project_id, source_id, notes")
+                .in_("project_id", project_ids)
+                .execute()
+            )
+
+            for source_link in response.data or []:
+                sources = sources_by_project.get(source_link.get("project_id"))
+                if sources is None:
+                    continue
+                if source_link.get("notes") == "technical":
+                    sources["technical_sources"].append(source_link["source_id"])
+                elif source_link.get("notes") == "business":
+                    sources["business_sources"].append(source_link["source_id"])
+
+            return True, sources_by_project
+        except Exception as e:
+            logger.error(f"Error getting sources for projects: {e}")
+            return False, sources_by_project
+
     def update_project_sources(
         self,
         project_id: str,
@@ -86,17 +124,9 @@ class SourceLinkingService:
                 ).eq("notes", "technical").execute()
 
                 # Add new technical sources
-                for source_id in technical_sources:
-                    try:
-                        self.supabase_client.table("archon_project_sources").insert({
-                            "project_id": project_id,
-                            "source_id": source_id,
-                            "notes": "technical",
-                        }).execute()
-                        result["technical_success"] += 1
-                    except Exception as e:
-                        result["technical_failed"] += 1
-                        logger.warning(f"Failed to link technical source {source_id}: {e}")
+                linked, failed = self._link_sources(project_id, technical_sources, "technical")
+                result["technical_success"] += linked
+                result["technical_failed"] += failed
 
             # Update business sources if provided
             if business_sources is not None:
@@ -106,17 +136,9 @@ class SourceLinkingService:
                 ).eq("notes", "business").execute()
 
                 # Add new business sources
-                for source_id in business_sources:
-                    try:
-                        self.supabase_client.table("archon_project_sources").insert({
-                            "project_id": project_id,
-                            "source_id": source_id,
-                            "notes": "business",
-                        }).execute()
-                        result["business_success"] += 1
-                    except Exception as e:
-                        result["business_failed"] += 1
-                        logger.warning(f"Failed to link business source {source_id}: {e}")
+                linked, failed = self._link_sources(project_id, business_sources, "business")
+                result["business_success"] += linked
+                result["business_failed"] += failed
 
             # Overall success if no critical failures
             total_failed = result["technical_failed"] + result["business_failed"]
@@ -127,19 +149,61 @@ class SourceLinkingService:
             logger.error(f"Error updating project sources: {e}")
             return False, {"error": str(e), **result}
 
-    def format_project_with_sources(self, project: dict[str, Any]) -> dict[str, Any]:
+    def _link_sources(
+        self, project_id: str, source_ids: list[str], notes: str
+    ) -> tuple[int, int]:
+        """
+        Link sources to a project in a single insert, falling back to
+        one insert per source so a bad row only fails itself.
+
+        Returns:
+            Tuple of (linked_count, failed_count)
+        """
+        if not source_ids:
+            return 0, 0
+
+        rows = [
+            {"project_id": project_id, "source_id": source_id, "notes": notes}
+            for source_id in source_ids
+        ]
+        try:
+            self.supabase_client.table("archon_project_sources").insert(rows).execute()
+            return len(rows), 0
+        except Exception as e:
+            logger.warning(f"Batch link of {len(rows)} {notes} sources failed, retrying individually: {e}")
+
+        linked = failed = 0
+        for row in rows:
+            try:
+                self.supabase_client.table("archon_project_sources").insert(row).execute()
+                linked += 1
+            except Exception as e:
+                failed += 1
+                logger.warning(f"Failed to link {notes} source {row['source_id']}: {e}")
+        return linked, failed
+
+    def format_project_with_sources(
+        self,
+        project: dict[str, Any],
+        sources: dict[str, list[str]] | None = None,
+    ) -> dict[str, Any]:
         """
         Format a project dict with its linked sources included.
         Also handles datetime conversion for JSON compatibility.
 
+        Args:
+            project: Project row to format
+            sources: Pre-fetched linked sources; fetched for this project when omitted
+
         Returns:
             Formatted project dict with technical_sources and business_sources
         """
         # Get linked sources
-        success, sources = self.get_project_sources(project["id"])
-        if not success:
-            logger.warning(f"Failed to get sources for project {project['id']}")
-            sources = {"technical_sources": [], "business_sources": []}
+        if sources is None:
+            success, sources = self.get_project_sources(project["id"])
+            if not success:
+                logger.warning(f"Failed to get sources for project {project['id']}")
+                sources = {"technical_sources": [], "business_sources": []}
 
         # Ensure datetime objects are converted to strings
         created_at = project.get("created_at", "")
@@ -168,10 +232,18 @@ class SourceLinkingService:
         """
         Format a list of projects with their linked sources.
 
+        Sources for all projects are fetched in one query rather than one per project.
+
         Returns:
             List of formatted project dicts
         """
-        formatted_projects = []
-        for project in projects:
-            formatted_projects.append(self.format_project_with_sources(project))
-        return formatted_projects
+        success, sources_by_project = self.get_sources_for_projects(
+            [project["id"] for project in projects]
+        )
+        if not success:
+            logger.warning("Failed to get sources for projects")
+
+        return [
+            self.format_project_with_sources(project, sources_by_project[project["id"]])
+            for project in projects
+        ]
@@ -5,7 +5,7 @@ This module provides core business logic for task operations that can be
 shared between MCP tools and FastAPI endpoints.
 """
 
-# Removed direct logging import - using unified config
+import logging
 from datetime import datetime
 from typing import Any
 
@@ -92,27 +92,9 @@ class TaskService:
 
             # REORDERING LOGIC: If inserting at a specific position, increment existing tasks
             if task_order > 0:
-                # Get all tasks in the same project and status with task_order >= new task's order
-                existing_tasks_response = (
-                    self.supabase_client.table("archon_tasks")
-                    .select("id, task_order")
-                    .eq("project_id", project_id)
-                    .eq("status", task_status)
-                    .gte("task_order", task_order)
-                    .execute()
-                )
-
-                if existing_tasks_response.data:
-                    logger.info(f"Reordering {len(existing_tasks_response.data)} existing tasks")
-
-                    # Increment task_order for all affected tasks
-                    for existing_task in existing_tasks_response.data:
-                        new_order = existing_task["task_order"] + 1
-                        self.supabase_client.table("archon_tasks").update({
-                            "task_order": new_order,
-                            "updated_at": datetime.now().isoformat(),
-                        }).eq("id", existing_task["id"]).execute()
+                self._shift_task_order(project_id, task_status, task_order)
 
+            now = datetime.now().isoformat()
             task_data = {
                 "project_id": project_id,
                 "title": title,
@@ -123,8 +105,8 @@ class TaskService:
                 "priority": priority,
                 "sources": sources or [],
                 "code_examples": code_examples or [],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now,
+                "updated_at": now,
             }
 
             if feature:
@@ -156,6 +138,51 @@ class TaskService:
             logger.error(f"Error creating task: {e}")
             return False, {"error": f"Error creating task: {str(e)}"}
 
+    def _shift_task_order(self, project_id: str, status: str, from_order: int) -> None:
+        """
+        Move every task in the project and status with task_order >= from_order
+        down one slot.
+
+        Uses the archon_shift_task_order RPC (migration 013) to do this in a single
+        UPDATE, falling back to one update per task when the RPC is unavailable.
+        """
+        try:
+            shift_response = self.supabase_client.rpc(
+                "archon_shift_task_order",
+                {
+                    "project_id_param": project_id,
+                    "status_param": status,
+                    "from_order_param": from_order,
+                },
+            ).execute()
+
+            if shift_response.data:
+                logger.info(f"Reordered {shift_response.data} existing tasks")
+            return
+        except Exception as e:
+            logger.warning(f"Task order shift RPC failed, reordering tasks individually: {e}")
+
+        # Get all tasks in the same project and status with task_order >= new task's order
+        existing_tasks_response = (
+            self.supabase_client.table("archon_tasks")
+            .select("id, task_order")
+            .eq("project_id", project_id)
+            .eq("status", status)
+            .gte("task_order", from_order)
+            .execute()
+        )
+
+        if existing_tasks_response.data:
+            logger.info(f"Reordering {len(existing_tasks_response.data)} existing tasks")
+
+            # Increment task_order for all affected tasks
+            now = datetime.now().isoformat()
+            for existing_task in existing_tasks_response.data:
+                self.supabase_client.table("archon_tasks").update({
+                    "task_order": existing_task["task_order"] + 1,
+                    "updated_at": now,
+                }).eq("id", existing_task["id"]).execute()
+
     def list_tasks(
         self,
         project_id: str = None,
@@ -255,8 +282,9 @@ class TaskService:
                 query.order("task_order", desc=False).order("created_at", desc=False).execute()
             )
 
-            # Debug: Log task status distribution and filter effectiveness
-            if response.data:
+            # Debug: Log task status distribution and filter effectiveness.
+            # Tallying walks every row, so only do it when debug logging is on
+            if response.data and logger.isEnabledFor(logging.DEBUG):
                 status_counts = {}
                 archived_counts = {"null": 0, "true": 0, "false": 0}
 
@@ -277,16 +305,16 @@ class TaskService:
                     f"Retrieved {len(response.data)} tasks. Status distribution: {status_counts}"
                 )
                 logger.debug(f"Archived field distribution: {archived_counts}")
-
-                # If we're filtering by status and getting wrong results, log sample
-                if status and len(response.data) > 0:
-                    first_task = response.data[0]
-                    logger.warning(
-                        f"Status filter: {status}, First task status: {first_task.get('status')}, archived: {first_task.get('archived')}"
-                    )
-            else:
+            elif not response.data:
                 logger.debug("No tasks found with current filters")
 
+            # If we're filtering by status and getting wrong results, log sample
+            if status and response.data and response.data[0].get("status") != status:
+                first_task = response.data[0]
+                logger.warning(
+                    f"Status filter: {status}, First task status: {first_task.get('status')}, archived: {first_task.get('archived')}"
+                )
+
             tasks = []
             for task in response.data:
                 task_data = {
@@ -444,11 +472,12 @@ class TaskService:
                 return False, {"error": f"Task with ID {task_id} is already archived"}
 
             # Archive the task
+            now = datetime.now().isoformat()
             archive_data = {
                 "archived": True,
-                "archived_at": datetime.now().isoformat(),
+                "archived_at": now,
                 "archived_by": archived_by,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": now,
             }
 
             # Archive the main task
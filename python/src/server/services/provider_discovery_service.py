@@ -5,6 +5,7 @@ Discovers available models, checks provider health, and provides model specifica
 for OpenAI, Google Gemini, Ollama, Anthropic, and Grok providers.
 """
 
+import asyncio
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -278,13 +279,17 @@ class ProviderDiscoveryService:
                     if response.status == 200:
                         data = await response.json()
                         models = []
+                        # Tags of the same model share a name once stripped, so probe each once
+                        tool_support: dict[str, bool] = {}
 
                         for model_info in data.get("models", []):
                             model_name = model_info.get("name", "").split(':')[0]  # Remove tag
 
                             # Determine model capabilities based on testing and name patterns
                             # Test for function calling capabilities via actual API calls
-                            supports_tools = await self._test_tool_support(model_name, api_url)
+                            if model_name not in tool_support:
+                                tool_support[model_name] = await self._test_tool_support(model_name, api_url)
+                            supports_tools = tool_support[model_name]
                             # Vision support is typically indicated by name patterns (reliable indicator)
                             supports_vision = any(pattern in model_name.lower() for pattern in VISION_MODEL_PATTERNS)
                             # Embedding support is typically indicated by name patterns (reliable indicator)  
@@ -520,6 +525,11 @@ class ProviderDiscoveryService:
         """Get all available models from all configured providers."""
         providers = {}
 
+        # Look up every provider's configuration first, then run the discovery calls;
+        # they are independent, so run them concurrently instead of awaiting each
+        # network round-trip in turn
+        discovery_args = {}
+
         try:
             # Get provider configurations
             rag_settings = await credential_service.get_credentials_by_category("rag_strategy")
@@ -527,26 +537,40 @@ class ProviderDiscoveryService:
             # OpenAI
             openai_key = await credential_service.get_credential("OPENAI_API_KEY")
             if openai_key:
-                providers["openai"] = await self.discover_openai_models(openai_key)
+                discovery_args["openai"] = (self.discover_openai_models, openai_key)
 
             # Google
             google_key = await credential_service.get_credential("GOOGLE_API_KEY")
             if google_key:
-                providers["google"] = await self.discover_google_models(google_key)
+                discovery_args["google"] = (self.discover_google_models, google_key)
 
             # Ollama
             ollama_urls = [rag_settings.get("LLM_BASE_URL", DEFAULT_OLLAMA_URL)]
-            providers["ollama"] = await self.discover_ollama_models(ollama_urls)
+            discovery_args["ollama"] = (self.discover_ollama_models, ollama_urls)
 
             # Anthropic
             anthropic_key = await credential_service.get_credential("ANTHROPIC_API_KEY")
             if anthropic_key:
-                providers["anthropic"] = await self.discover_anthropic_models(anthropic_key)
+                discovery_args["anthropic"] = (self.discover_anthropic_models, anthropic_key)
 
             # Grok
             grok_key = await credential_service.get_credential("GROK_API_KEY")
             if grok_key:
-                providers["grok"] = await self.discover_grok_models(grok_key)
+                discovery_args["grok"] = (self.discover_grok_models, grok_key)
+
+        except Exception as e:
+            # Still discover the providers configured before the failing lookup
+            logger.error(f"Error getting all available models: {e}")
+
+        if not discovery_args:
+            return providers
+
+        try:
+            # Create the coroutines only now, so a failed lookup never leaves one un-awaited
+            results = await asyncio.gather(
+                *(discover(arg) for discover, arg in discovery_args.values())
+            )
+            providers = dict(zip(discovery_args.keys(), results, strict=True))
 
         except Exception as e:
             logger.error(f"Error getting all available models: {e}")
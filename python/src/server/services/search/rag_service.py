@@ -201,37 +201,48 @@ class RAGService:
             page_groups[group_key]["chunk_matches"] += 1
             page_groups[group_key]["total_similarity"] += result.get("similarity_score", 0.0)
 
+        # Fetch metadata for all pages in at most two queries: by page_id, then by URL
+        # for groups without one (regular pages - exact URL match)
+        page_ids = [data["page_id"] for data in page_groups.values() if data["page_id"]]
+        page_urls = [data["url"] for data in page_groups.values() if not data["page_id"]]
+        pages_by_id: dict[str, dict[str, Any]] = {}
+        pages_by_url: dict[str, dict[str, Any]] = {}
+
+        if page_ids:
+            response = (
+                self.supabase_client.table("archon_page_metadata")
+                .select("id, url, section_title, word_count")
+                .in_("id", page_ids)
+                .execute()
+            )
+            pages_by_id = {page["id"]: page for page in response.data or []}
+
+        if page_urls:
+            response = (
+                self.supabase_client.table("archon_page_metadata")
+                .select("id, url, section_title, word_count")
+                .in_("url", page_urls)
+                .execute()
+            )
+            pages_by_url = {page["url"]: page for page in response.data or []}
+
         page_results = []
-        for group_key, data in page_groups.items():
+        for data in page_groups.values():
             avg_similarity = data["total_similarity"] / data["chunk_matches"]
             match_boost = min(0.2, data["chunk_matches"] * 0.02)
             aggregate_score = avg_similarity * (1 + match_boost)
 
-            # Query page by page_id if available, otherwise by URL
             if data["page_id"]:
-                page_info = (
-                    self.supabase_client.table("archon_page_metadata")
-                    .select("id, url, section_title, word_count")
-                    .eq("id", data["page_id"])
-                    .maybe_single()
-                    .execute()
-                )
+                page_info = pages_by_id.get(data["page_id"])
             else:
-                # Regular pages - exact URL match
-                page_info = (
-                    self.supabase_client.table("archon_page_metadata")
-                    .select("id, url, section_title, word_count")
-                    .eq("url", data["url"])
-                    .maybe_single()
-                    .execute()
-                )
+                page_info = pages_by_url.get(data["url"])
 
-            if page_info and page_info.data is not None:
+            if page_info is not None:
                 page_results.append({
-                    "page_id": page_info.data["id"],
-                    "url": page_info.data["url"],
-                    "section_title": page_info.data.get("section_title"),
-                    "word_count": page_info.data.get("word_count", 0),
+                    "page_id": page_info["id"],
+                    "url": page_info["url"],
+                    "section_title": page_info.get("section_title"),
+                    "word_count": page_info.get("word_count", 0),
                     "chunk_matches": data["chunk_matches"],
                     "aggregate_similarity": aggregate_score,
                     "average_similarity": avg_similarity,
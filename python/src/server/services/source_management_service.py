@@ -625,7 +625,12 @@ class SourceManagementService:
             Tuple of (success, result_dict)
         """
         try:
-            query = self.supabase_client.table("archon_sources").select("*")
+            # Select only the listed columns and extract knowledge_type/tags in the
+            # database rather than transferring the full metadata JSONB per source
+            query = self.supabase_client.table("archon_sources").select(
+                "source_id, title, summary, total_word_count, created_at, updated_at, "
+                "knowledge_type:metadata->>knowledge_type, tags:metadata->tags"
+            )
 
             if knowledge_type:
                 # Filter by metadata->knowledge_type
@@ -635,13 +640,12 @@ class SourceManagementService:
 
             sources = []
             for row in response.data:
-                metadata = row.get("metadata", {})
                 sources.append({
                     "source_id": row["source_id"],
                     "title": row.get("title", ""),
                     "summary": row.get("summary", ""),
-                    "knowledge_type": metadata.get("knowledge_type", ""),
-                    "tags": metadata.get("tags", []),
+                    "knowledge_type": row.get("knowledge_type") or "",
+                    "tags": row.get("tags") or [],
                     "total_word_count": row.get("total_word_count", 0),
                     "created_at": row.get("created_at", ""),
                     "updated_at": row.get("updated_at", ""),
@@ -1160,13 +1160,24 @@ async def add_code_examples_to_supabase(
     if not urls:
         return
 
-    # Delete existing records for these URLs
+    # Delete existing records for these URLs in batches (one IN query per batch)
     unique_urls = list(set(urls))
-    for url in unique_urls:
+    delete_batch_size = 50
+    for i in range(0, len(unique_urls), delete_batch_size):
+        batch_urls = unique_urls[i : i + delete_batch_size]
         try:
-            client.table("archon_code_examples").delete().eq("url", url).execute()
+            client.table("archon_code_examples").delete().in_("url", batch_urls).execute()
         except Exception as e:
-            search_logger.error(f"Error deleting existing code examples for {url}: {e}")
+            search_logger.warning(
+                f"Batch delete of code examples failed: {e}. Falling back to per-URL deletes."
+            )
+            for url in batch_urls:
+                try:
+                    client.table("archon_code_examples").delete().eq("url", url).execute()
+                except Exception as inner_e:
+                    search_logger.error(
+                        f"Error deleting existing code examples for {url}: {inner_e}"
+                    )
 
     # Check if contextual embeddings are enabled (use proper async method like document storage)
     try:
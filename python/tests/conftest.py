@@ -1,7 +1,7 @@
 """Simple test configuration for Archon - Essential tests only."""
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -133,6 +133,33 @@ def mock_supabase_client():
     return mock_client
 
 
+class _TableQueries(dict):
+    """Per-table chainable query mocks, built on first access."""
+
+    _CHAIN_METHODS = ("select", "eq", "contains", "or_", "range", "order", "in_", "limit", "single")
+
+    def __missing__(self, table):
+        # Query builders only need attribute chaining, so a plain Mock is enough
+        query = Mock()
+        for method in self._CHAIN_METHODS:
+            getattr(query, method).return_value = query
+        self[table] = query
+        return query
+
+
+@pytest.fixture
+def mock_supabase():
+    """Supabase client mock whose from_(table) returns one chainable query per table.
+
+    Arrange results through mock_supabase.tables[table] so that setup does not
+    record from_() calls.
+    """
+    client = MagicMock()
+    client.tables = _TableQueries()
+    client.from_.side_effect = client.tables.__getitem__
+    return client
+
+
 @pytest.fixture
 def client(mock_supabase_client):
     """FastAPI test client with mocked database."""
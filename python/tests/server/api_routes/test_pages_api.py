@@ -0,0 +1,100 @@
+"""
+Unit tests for pages_api.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.server.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def page_rows():
+    """Summary rows as returned by archon_page_metadata."""
+    return [
+        {
+            "id": "page-1",
+            "url": "https://docs.example.com/a",
+            "section_title": "Intro",
+            "section_order": 0,
+            "word_count": 120,
+            "char_count": 800,
+            "chunk_count": 2,
+        },
+        {
+            "id": "page-2",
+            "url": "https://docs.example.com/b",
+            "section_title": None,
+            "section_order": 1,
+            "word_count": 40,
+            "char_count": 250,
+            "chunk_count": 1,
+        },
+    ]
+
+
+def _mock_pages_client(rows):
+    mock_client = MagicMock()
+    query = mock_client.table.return_value.select.return_value.eq.return_value
+    query.eq.return_value = query
+    query.order.return_value = query
+    query.execute.return_value = SimpleNamespace(data=rows)
+    return mock_client
+
+
+def test_list_pages_returns_summaries(client, page_rows):
+    """Test listing pages for a source."""
+    with patch("src.server.api_routes.pages_api.get_supabase_client") as mock_get_client:
+        mock_get_client.return_value = _mock_pages_client(page_rows)
+
+        response = client.get("/api/pages", params={"source_id": "src-1"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["total"] == 2
+        assert data["source_id"] == "src-1"
+        assert [page["id"] for page in data["pages"]] == ["page-1", "page-2"]
+        assert data["pages"][1]["section_title"] is None
+
+
+def test_list_pages_rejects_malformed_rows(client, page_rows):
+    """Test that rows missing required fields surface as a server error."""
+    del page_rows[0]["word_count"]
+    with patch("src.server.api_routes.pages_api.get_supabase_client") as mock_get_client:
+        mock_get_client.return_value = _mock_pages_client(page_rows)
+
+        response = client.get("/api/pages", params={"source_id": "src-1"})
+
+        assert response.status_code == 500
+
+
+def test_get_page_by_id_returns_full_page(client, page_rows):
+    """Test that a single page includes the summary fields plus its content."""
+    page = {
+        **page_rows[0],
+        "source_id": "src-1",
+        "full_content": "# Intro\nHello",
+        "metadata": {},
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+    with patch("src.server.api_routes.pages_api.get_supabase_client") as mock_get_client:
+        mock_client = MagicMock()
+        query = mock_client.table.return_value.select.return_value.eq.return_value.single.return_value
+        query.execute.return_value = SimpleNamespace(data=page)
+        mock_get_client.return_value = mock_client
+
+        response = client.get("/api/pages/page-1")
+
+        assert response.status_code == 200
+        assert response.json() == page
@@ -0,0 +1,39 @@
+"""
+Unit tests for project_service.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.server.services.projects.project_service import ProjectService
+
+
+def test_delete_project_checks_existence_and_counts_tasks_in_one_query():
+    """Existence check and task count come from one embedded-count select."""
+    client = MagicMock()
+    select = client.table.return_value.select
+    select.return_value.eq.return_value.execute.return_value = SimpleNamespace(
+        data=[{"id": "project-1", "archon_tasks": [{"count": 4}]}]
+    )
+
+    service = ProjectService(client)
+    success, result = service.delete_project("project-1")
+
+    assert success is True
+    assert result["deleted_tasks"] == 4
+    select.assert_called_once_with("id, archon_tasks(count)")
+    client.table.return_value.delete.return_value.eq.assert_called_once_with("id", "project-1")
+
+
+def test_delete_project_not_found():
+    client = MagicMock()
+    client.table.return_value.select.return_value.eq.return_value.execute.return_value = SimpleNamespace(
+        data=[]
+    )
+
+    service = ProjectService(client)
+    success, result = service.delete_project("missing")
+
+    assert success is False
+    assert "not found" in result["error"]
+    client.table.return_value.delete.assert_not_called()
@@ -0,0 +1,93 @@
+"""
+Unit tests for source_linking_service.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.server.services.projects.source_linking_service import SourceLinkingService
+
+
+def _projects(*project_ids):
+    return [{"id": project_id, "title": f"Project {project_id}"} for project_id in project_ids]
+
+
+def test_format_projects_with_sources_uses_single_query():
+    """Linked sources for every project are fetched with one IN query."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.in_.return_value
+    query.execute.return_value = SimpleNamespace(
+        data=[
+            {"project_id": "p1", "source_id": "s1", "notes": "technical"},
+            {"project_id": "p1", "source_id": "s2", "notes": "business"},
+            {"project_id": "p2", "source_id": "s3", "notes": "technical"},
+        ]
+    )
+
+    service = SourceLinkingService(client)
+    result = service.format_projects_with_sources(_projects("p1", "p2", "p3"))
+
+    client.table.assert_called_once_with("archon_project_sources")
+    client.table.return_value.select.return_value.in_.assert_called_once_with(
+        "project_id", ["p1", "p2", "p3"]
+    )
+    assert [p["technical_sources"] for p in result] == [["s1"], ["s3"], []]
+    assert [p["business_sources"] for p in result] == [["s2"], [], []]
+
+
+def test_format_projects_with_sources_falls_back_to_empty_on_error():
+    """A failed source lookup still returns every project with empty source lists."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.in_.return_value
+    query.execute.side_effect = Exception("connection reset")
+
+    service = SourceLinkingService(client)
+    result = service.format_projects_with_sources(_projects("p1"))
+
+    assert result[0]["id"] == "p1"
+    assert result[0]["technical_sources"] == []
+    assert result[0]["business_sources"] == []
+
+
+def test_format_projects_with_sources_skips_query_for_empty_list():
+    client = MagicMock()
+
+    service = SourceLinkingService(client)
+
+    assert service.format_projects_with_sources([]) == []
+    client.table.assert_not_called()
+
+
+def test_update_project_sources_links_sources_in_single_insert():
+    """Replacing a project's sources inserts every link with one request."""
+    client = MagicMock()
+
+    service = SourceLinkingService(client)
+    success, result = service.update_project_sources("p1", technical_sources=["s1", "s2", "s3"])
+
+    assert success is True
+    assert result["technical_success"] == 3
+    assert result["technical_failed"] == 0
+    client.table.return_value.insert.assert_called_once_with([
+        {"project_id": "p1", "source_id": "s1", "notes": "technical"},
+        {"project_id": "p1", "source_id": "s2", "notes": "technical"},
+        {"project_id": "p1", "source_id": "s3", "notes": "technical"},
+    ])
+    assert client.table.return_value.insert.return_value.execute.call_count == 1
+
+
+def test_update_project_sources_retries_individually_when_batch_fails():
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.side_effect = [
+        Exception("violates foreign key constraint"),
+        None,
+        Exception("violates foreign key constraint"),
+    ]
+
+    service = SourceLinkingService(client)
+    success, result = service.update_project_sources("p1", business_sources=["s1", "missing"])
+
+    assert success is True
+    assert result["business_success"] == 1
+    assert result["business_failed"] == 1
+    assert client.table.return_value.insert.call_count == 3
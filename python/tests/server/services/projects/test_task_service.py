@@ -0,0 +1,125 @@
+"""
+Unit tests for task_service.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.server.services.projects.task_service import TaskService
+
+_TASK_ROW = {
+    "id": "task-1",
+    "project_id": "project-1",
+    "title": "New task",
+    "description": "",
+    "status": "todo",
+    "assignee": "User",
+    "task_order": 2,
+    "priority": "medium",
+    "created_at": "2024-01-01T00:00:00",
+}
+
+
+def _inserted_task(**overrides):
+    return {**_TASK_ROW, **overrides}
+
+
+@pytest.mark.asyncio
+async def test_create_task_shifts_existing_tasks_in_single_rpc():
+    """Inserting at a position shifts the column with one RPC instead of one UPDATE per task."""
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = SimpleNamespace(data=3)
+    client.table.return_value.insert.return_value.execute.return_value = SimpleNamespace(
+        data=[_inserted_task()]
+    )
+
+    service = TaskService(client)
+    success, result = await service.create_task("project-1", "New task", task_order=2)
+
+    assert success is True
+    assert result["task"]["task_order"] == 2
+    client.rpc.assert_called_once_with(
+        "archon_shift_task_order",
+        {"project_id_param": "project-1", "status_param": "todo", "from_order_param": 2},
+    )
+    client.table.return_value.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_task_falls_back_to_per_task_shift_without_rpc():
+    """Without migration 013 the existing tasks are still shifted, one update each."""
+    client = MagicMock()
+    client.rpc.return_value.execute.side_effect = Exception("function archon_shift_task_order does not exist")
+    table = client.table.return_value
+    existing = table.select.return_value.eq.return_value.eq.return_value.gte.return_value
+    existing.execute.return_value = SimpleNamespace(
+        data=[{"id": "task-2", "task_order": 2}, {"id": "task-3", "task_order": 5}]
+    )
+    table.insert.return_value.execute.return_value = SimpleNamespace(data=[_inserted_task()])
+
+    service = TaskService(client)
+    success, result = await service.create_task("project-1", "New task", task_order=2)
+
+    assert success is True
+    assert result["task"]["task_order"] == 2
+    assert [call.args[0]["task_order"] for call in table.update.call_args_list] == [3, 6]
+    assert [call.args for call in table.update.return_value.eq.call_args_list] == [
+        ("id", "task-2"),
+        ("id", "task-3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_task_at_top_does_not_shift():
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.return_value = SimpleNamespace(
+        data=[_inserted_task(task_order=0)]
+    )
+
+    service = TaskService(client)
+    success, _ = await service.create_task("project-1", "New task", task_order=0)
+
+    assert success is True
+    client.rpc.assert_not_called()
+
+
+def _list_tasks_client(rows):
+    query = MagicMock()
+    for method in ("select", "eq", "neq", "or_", "order"):
+        getattr(query, method).return_value = query
+    query.execute.return_value = SimpleNamespace(data=rows)
+    client = MagicMock()
+    client.table.return_value = query
+    return client
+
+
+def test_list_tasks_skips_status_tally_when_debug_disabled():
+    """The per-row status distribution is only computed when debug logging is enabled."""
+    rows = [_inserted_task(id=f"task-{i}", updated_at="2024-01-01T00:00:00") for i in range(3)]
+    service = TaskService(_list_tasks_client(rows))
+
+    with patch("src.server.services.projects.task_service.logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+        success, result = service.list_tasks(project_id="project-1", status="todo")
+
+    assert success is True
+    assert [task["id"] for task in result["tasks"]] == ["task-0", "task-1", "task-2"]
+    debug_messages = [call.args[0] for call in mock_logger.debug.call_args_list]
+    assert not any("Status distribution" in message for message in debug_messages)
+    mock_logger.warning.assert_not_called()
+
+
+def test_list_tasks_warns_when_status_filter_returns_other_status():
+    rows = [_inserted_task(status="done", updated_at="2024-01-01T00:00:00")]
+    service = TaskService(_list_tasks_client(rows))
+
+    with patch("src.server.services.projects.task_service.logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = True
+        success, _ = service.list_tasks(project_id="project-1", status="todo")
+
+    assert success is True
+    debug_messages = [call.args[0] for call in mock_logger.debug.call_args_list]
+    assert any("Status distribution: {'done': 1}" in message for message in debug_messages)
+    mock_logger.warning.assert_called_once()
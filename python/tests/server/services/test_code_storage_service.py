@@ -0,0 +1,62 @@
+"""
+Unit tests for code_storage_service.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.server.services.storage.code_storage_service import add_code_examples_to_supabase
+
+URLS = [f"https://docs.example.com/page-{i}" for i in range(3)]
+
+
+async def _store_code_examples(client):
+    # Empty code blocks stop after the delete step without building embeddings
+    with patch(
+        "src.server.services.storage.code_storage_service.credential_service.get_credential",
+        AsyncMock(return_value="false"),
+    ), patch(
+        "src.server.services.storage.code_storage_service.create_embeddings_batch",
+        AsyncMock(return_value=SimpleNamespace(has_failures=False, embeddings=[], texts_processed=[])),
+    ), patch(
+        "src.server.services.llm_provider_service.get_embedding_model",
+        AsyncMock(return_value="text-embedding-3-small"),
+    ), patch(
+        "src.server.services.storage.code_storage_service._get_model_choice",
+        AsyncMock(return_value="gpt-4o-mini"),
+    ):
+        await add_code_examples_to_supabase(
+            client,
+            urls=URLS + URLS[:1],
+            chunk_numbers=[0, 1, 2, 3],
+            code_examples=["", "", "", ""],
+            summaries=["", "", "", ""],
+            metadatas=[{}, {}, {}, {}],
+        )
+
+
+@pytest.mark.asyncio
+async def test_add_code_examples_deletes_existing_rows_in_one_request():
+    """Existing examples for every URL are cleared with one IN delete, never per URL."""
+    client = MagicMock()
+    delete = client.table.return_value.delete.return_value
+
+    await _store_code_examples(client)
+
+    delete.in_.assert_called_once()
+    assert sorted(delete.in_.call_args.args[1]) == URLS
+    assert delete.in_.return_value.execute.call_count == 1
+    delete.eq.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_code_examples_falls_back_to_per_url_deletes():
+    client = MagicMock()
+    delete = client.table.return_value.delete.return_value
+    delete.in_.return_value.execute.side_effect = Exception("statement timeout")
+
+    await _store_code_examples(client)
+
+    assert sorted(call.args[1] for call in delete.eq.call_args_list) == URLS
@@ -0,0 +1,98 @@
+"""
+Unit tests for knowledge_item_service.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.server.services.knowledge.knowledge_item_service import KnowledgeItemService
+
+
+def _source_row(source_id, title, url):
+    return {"source_id": source_id, "title": title, "source_url": url, "metadata": {}}
+
+
+@pytest.mark.asyncio
+async def test_list_items_fetches_code_example_counts_in_single_rpc(mock_supabase):
+    """Code example counts come from one RPC; chunk counts stay 0 so crawled pages are not counted."""
+    sources = [
+        _source_row("src-1", "One", "https://one.example.com"),
+        _source_row("src-2", "Two", "https://two.example.com"),
+    ]
+    mock_supabase.tables["archon_sources"].execute.return_value = SimpleNamespace(data=sources, count=2)
+    mock_supabase.rpc.return_value.execute.return_value = SimpleNamespace(
+        data=[
+            {"source_id": "src-1", "document_count": 0, "code_example_count": 3},
+            {"source_id": "src-2", "document_count": 0, "code_example_count": 0},
+        ]
+    )
+
+    service = KnowledgeItemService(mock_supabase)
+    result = await service.list_items(page=1, per_page=20)
+
+    mock_supabase.rpc.assert_called_once_with(
+        "archon_get_source_counts",
+        {"source_ids": ["src-1", "src-2"], "include_document_counts": False},
+    )
+    items = {item["source_id"]: item for item in result["items"]}
+    assert items["src-1"]["metadata"]["code_examples_count"] == 3
+    assert items["src-1"]["metadata"]["chunks_count"] == 0
+    assert items["src-1"]["code_examples"] == [{"count": 3}]
+    assert items["src-2"]["code_examples"] == []
+
+    tables = [call.args[0] for call in mock_supabase.from_.call_args_list]
+    assert "archon_code_examples" not in tables
+    assert "archon_crawled_pages" not in tables
+
+
+@pytest.mark.asyncio
+async def test_list_items_counts_code_examples_per_source_when_rpc_fails(mock_supabase):
+    sources = [_source_row("src-1", "One", "https://one.example.com")]
+    mock_supabase.tables["archon_sources"].execute.return_value = SimpleNamespace(data=sources, count=1)
+    mock_supabase.tables["archon_code_examples"].execute.return_value = SimpleNamespace(count=4)
+    mock_supabase.rpc.return_value.execute.side_effect = Exception("function does not exist")
+
+    service = KnowledgeItemService(mock_supabase)
+    result = await service.list_items(page=1, per_page=20)
+
+    assert result["items"][0]["metadata"]["code_examples_count"] == 4
+    assert result["items"][0]["metadata"]["chunks_count"] == 0
+    assert "archon_crawled_pages" not in mock_supabase.tables
+
+
+@pytest.mark.asyncio
+async def test_get_item_crawl_config_uses_original_url_without_extra_queries(mock_supabase):
+    """Refresh config reads only the source metadata when the original URL is recorded."""
+    metadata = {"original_url": "https://docs.example.com", "knowledge_type": "technical", "max_depth": 3}
+    mock_supabase.tables["archon_sources"].execute.return_value = SimpleNamespace(data={"metadata": metadata})
+
+    service = KnowledgeItemService(mock_supabase)
+    config = await service.get_item_crawl_config("src-1")
+
+    assert config == {"url": "https://docs.example.com", "metadata": metadata}
+    tables = [call.args[0] for call in mock_supabase.from_.call_args_list]
+    assert tables == ["archon_sources"]
+
+
+@pytest.mark.asyncio
+async def test_get_item_crawl_config_falls_back_to_first_page_url(mock_supabase):
+    mock_supabase.tables["archon_sources"].execute.return_value = SimpleNamespace(data={"metadata": {}})
+    mock_supabase.tables["archon_crawled_pages"].execute.return_value = SimpleNamespace(
+        data=[{"url": "https://docs.example.com/intro"}]
+    )
+
+    service = KnowledgeItemService(mock_supabase)
+    config = await service.get_item_crawl_config("src-1")
+
+    assert config["url"] == "https://docs.example.com/intro"
+    assert "archon_code_examples" not in mock_supabase.tables
+
+
+@pytest.mark.asyncio
+async def test_get_item_crawl_config_returns_none_when_missing(mock_supabase):
+    mock_supabase.tables["archon_sources"].execute.side_effect = Exception("0 rows returned")
+
+    service = KnowledgeItemService(mock_supabase)
+
+    assert await service.get_item_crawl_config("missing") is None
@@ -0,0 +1,66 @@
+"""
+Unit tests for knowledge_summary_service.py
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.server.services.knowledge.knowledge_summary_service import KnowledgeSummaryService
+
+
+@pytest.mark.asyncio
+async def test_get_summaries_fetches_counts_in_single_rpc(mock_supabase):
+    """Counts for every source on the page come from one RPC, not per-source COUNT queries."""
+    sources = [
+        {"source_id": "src-1", "title": "One", "metadata": {"knowledge_type": "technical"}},
+        {"source_id": "src-2", "title": "Two", "metadata": {"knowledge_type": "business"}},
+    ]
+    mock_supabase.tables["archon_sources"].execute.return_value = SimpleNamespace(data=sources, count=2)
+    mock_supabase.tables["archon_crawled_pages"].execute.return_value = SimpleNamespace(
+        data=[{"source_id": "src-1", "url": "https://one.example.com"}]
+    )
+    mock_supabase.rpc.return_value.execute.return_value = SimpleNamespace(
+        data=[
+            {"source_id": "src-1", "document_count": 12, "code_example_count": 3},
+            {"source_id": "src-2", "document_count": 5, "code_example_count": 0},
+        ]
+    )
+
+    service = KnowledgeSummaryService(mock_supabase)
+    result = await service.get_summaries(page=1, per_page=20)
+
+    mock_supabase.rpc.assert_called_once_with(
+        "archon_get_source_counts",
+        {"source_ids": ["src-1", "src-2"], "include_document_counts": True},
+    )
+    items = {item["source_id"]: item for item in result["items"]}
+    assert items["src-1"]["document_count"] == 12
+    assert items["src-1"]["code_examples_count"] == 3
+    assert items["src-2"]["document_count"] == 5
+    assert items["src-2"]["code_examples_count"] == 0
+    assert items["src-1"]["url"] == "https://one.example.com"
+
+    # Only the sources table (list + total count) and the first-URL lookup hit from_()
+    tables = [call.args[0] for call in mock_supabase.from_.call_args_list]
+    assert "archon_code_examples" not in tables
+    assert tables.count("archon_crawled_pages") == 1
+
+
+@pytest.mark.asyncio
+async def test_get_summaries_skips_first_url_lookup_when_source_url_stored(mock_supabase):
+    """Sources that already carry source_url never trigger the crawled pages scan."""
+    sources = [
+        {"source_id": "src-1", "title": "One", "source_url": "https://one.example.com", "metadata": {}},
+    ]
+    mock_supabase.tables["archon_sources"].execute.return_value = SimpleNamespace(data=sources, count=1)
+    mock_supabase.rpc.return_value.execute.return_value = SimpleNamespace(
+        data=[{"source_id": "src-1", "document_count": 4, "code_example_count": 1}]
+    )
+
+    service = KnowledgeSummaryService(mock_supabase)
+    result = await service.get_summaries(page=1, per_page=20)
+
+    assert result["items"][0]["url"] == "https://one.example.com"
+    tables = [call.args[0] for call in mock_supabase.from_.call_args_list]
+    assert "archon_crawled_pages" not in tables
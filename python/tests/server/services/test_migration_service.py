@@ -69,24 +69,18 @@ def test_migration_record_init():
     assert record.checksum == "abc123"
 
 
-def test_migration_service_init_local():
-    """Test MigrationService initialization with local path."""
-    with patch("src.server.services.migration_service.Path.exists") as mock_exists:
-        # Mock that Docker path doesn't exist
-        mock_exists.return_value = False
-
-        service = MigrationService()
-        assert service._migrations_dir == Path("migration")
-
-
-def test_migration_service_init_docker():
-    """Test MigrationService initialization with Docker path."""
+@pytest.mark.parametrize(
+    ("docker_path_exists", "expected_dir"),
+    [(False, Path("migration")), (True, Path("/app/migration"))],
+    ids=["local", "docker"],
+)
+def test_migration_service_init_migrations_dir(docker_path_exists, expected_dir):
+    """Test MigrationService picks the Docker path when it exists, else the local one."""
     with patch("src.server.services.migration_service.Path.exists") as mock_exists:
-        # Mock that Docker path exists
-        mock_exists.return_value = True
+        mock_exists.return_value = docker_path_exists
 
         service = MigrationService()
-        assert service._migrations_dir == Path("/app/migration")
+        assert service._migrations_dir == expected_dir
 
 
 @pytest.mark.asyncio
@@ -105,23 +99,25 @@ async def test_get_applied_migrations_success(migration_service, mock_supabase_c
 
     mock_supabase_client.table.return_value.select.return_value.order.return_value.execute.return_value = mock_response
 
-    with patch.object(migration_service, '_get_supabase_client', return_value=mock_supabase_client):
-        with patch.object(migration_service, 'check_migrations_table_exists', return_value=True):
-            result = await migration_service.get_applied_migrations()
+    migration_service._get_supabase_client = Mock(return_value=mock_supabase_client)
+    migration_service.check_migrations_table_exists = AsyncMock(return_value=True)
+
+    result = await migration_service.get_applied_migrations()
 
-            assert len(result) == 1
-            assert isinstance(result[0], MigrationRecord)
-            assert result[0].version == "0.1.0"
-            assert result[0].migration_name == "001_initial"
+    assert len(result) == 1
+    assert isinstance(result[0], MigrationRecord)
+    assert result[0].version == "0.1.0"
+    assert result[0].migration_name == "001_initial"
 
 
 @pytest.mark.asyncio
 async def test_get_applied_migrations_table_not_exists(migration_service, mock_supabase_client):
     """Test handling when migrations table doesn't exist."""
-    with patch.object(migration_service, '_get_supabase_client', return_value=mock_supabase_client):
-        with patch.object(migration_service, 'check_migrations_table_exists', return_value=False):
-            result = await migration_service.get_applied_migrations()
-            assert result == []
+    migration_service._get_supabase_client = Mock(return_value=mock_supabase_client)
+    migration_service.check_migrations_table_exists = AsyncMock(return_value=False)
+
+    result = await migration_service.get_applied_migrations()
+    assert result == []
 
 
 @pytest.mark.asyncio
@@ -144,14 +140,15 @@ async def test_get_pending_migrations_with_files(migration_service, mock_supabas
     ]
 
     # Mock no applied migrations
-    with patch.object(migration_service, 'scan_migration_directory', return_value=mock_migrations):
-        with patch.object(migration_service, 'get_applied_migrations', return_value=[]):
-            result = await migration_service.get_pending_migrations()
+    migration_service.scan_migration_directory = AsyncMock(return_value=mock_migrations)
+    migration_service.get_applied_migrations = AsyncMock(return_value=[])
+
+    result = await migration_service.get_pending_migrations()
 
-            assert len(result) == 2
-            assert all(isinstance(m, PendingMigration) for m in result)
-            assert result[0].name == "001_initial"
-            assert result[1].name == "002_update"
+    assert len(result) == 2
+    assert all(isinstance(m, PendingMigration) for m in result)
+    assert result[0].name == "001_initial"
+    assert result[1].name == "002_update"
 
 
 @pytest.mark.asyncio
@@ -183,13 +180,14 @@ async def test_get_pending_migrations_some_applied(migration_service, mock_supab
         })
     ]
 
-    with patch.object(migration_service, 'scan_migration_directory', return_value=mock_all_migrations):
-        with patch.object(migration_service, 'get_applied_migrations', return_value=mock_applied):
-            with patch.object(migration_service, 'check_migrations_table_exists', return_value=True):
-                result = await migration_service.get_pending_migrations()
+    migration_service.scan_migration_directory = AsyncMock(return_value=mock_all_migrations)
+    migration_service.get_applied_migrations = AsyncMock(return_value=mock_applied)
+    migration_service.check_migrations_table_exists = AsyncMock(return_value=True)
 
-                assert len(result) == 1
-                assert result[0].name == "002_update"
+    result = await migration_service.get_pending_migrations()
+
+    assert len(result) == 1
+    assert result[0].name == "002_update"
 
 
 @pytest.mark.asyncio
@@ -215,16 +213,17 @@ async def test_get_migration_status_all_applied(migration_service, mock_supabase
         })
     ]
 
-    with patch.object(migration_service, 'scan_migration_directory', return_value=mock_all_migrations):
-        with patch.object(migration_service, 'get_applied_migrations', return_value=mock_applied):
-            with patch.object(migration_service, 'check_migrations_table_exists', return_value=True):
-                result = await migration_service.get_migration_status()
+    migration_service.scan_migration_directory = AsyncMock(return_value=mock_all_migrations)
+    migration_service.get_applied_migrations = AsyncMock(return_value=mock_applied)
+    migration_service.check_migrations_table_exists = AsyncMock(return_value=True)
+
+    result = await migration_service.get_migration_status()
 
-                assert result["current_version"] == ARCHON_VERSION
-                assert result["has_pending"] is False
-                assert result["bootstrap_required"] is False
-                assert result["pending_count"] == 0
-                assert result["applied_count"] == 1
+    assert result["current_version"] == ARCHON_VERSION
+    assert result["has_pending"] is False
+    assert result["bootstrap_required"] is False
+    assert result["pending_count"] == 0
+    assert result["applied_count"] == 1
 
 
 @pytest.mark.asyncio
@@ -246,26 +245,56 @@ async def test_get_migration_status_bootstrap_required(migration_service, mock_s
         )
     ]
 
-    with patch.object(migration_service, 'scan_migration_directory', return_value=mock_all_migrations):
-        with patch.object(migration_service, 'get_applied_migrations', return_value=[]):
-            with patch.object(migration_service, 'check_migrations_table_exists', return_value=False):
-                result = await migration_service.get_migration_status()
+    migration_service.scan_migration_directory = AsyncMock(return_value=mock_all_migrations)
+    migration_service.get_applied_migrations = AsyncMock(return_value=[])
+    migration_service.check_migrations_table_exists = AsyncMock(return_value=False)
 
-                assert result["bootstrap_required"] is True
-                assert result["has_pending"] is True
-                assert result["pending_count"] == 2
-                assert result["applied_count"] == 0
-                assert len(result["pending_migrations"]) == 2
+    result = await migration_service.get_migration_status()
+
+    assert result["bootstrap_required"] is True
+    assert result["has_pending"] is True
+    assert result["pending_count"] == 2
+    assert result["applied_count"] == 0
+    assert len(result["pending_migrations"]) == 2
 
 
 @pytest.mark.asyncio
 async def test_get_migration_status_no_files(migration_service, mock_supabase_client):
     """Test migration status when no migration files exist."""
-    with patch.object(migration_service, 'scan_migration_directory', return_value=[]):
-        with patch.object(migration_service, 'get_applied_migrations', return_value=[]):
-            with patch.object(migration_service, 'check_migrations_table_exists', return_value=True):
-                result = await migration_service.get_migration_status()
-
-                assert result["has_pending"] is False
-                assert result["pending_count"] == 0
-                assert len(result["pending_migrations"]) == 0
\ No newline at end of file
+    migration_service.scan_migration_directory = AsyncMock(return_value=[])
+    migration_service.get_applied_migrations = AsyncMock(return_value=[])
+    migration_service.check_migrations_table_exists = AsyncMock(return_value=True)
+
+    result = await migration_service.get_migration_status()
+
+    assert result["has_pending"] is False
+    assert result["pending_count"] == 0
+    assert len(result["pending_migrations"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_scan_migration_directory_reuses_unchanged_files(migration_service, tmp_path, monkeypatch):
+    """Unchanged migration files are served from the scan cache; edited files are re-read."""
+    monkeypatch.chdir(tmp_path)
+    version_dir = tmp_path / "migration" / "0.1.0"
+    version_dir.mkdir(parents=True)
+    first = version_dir / "001_first.sql"
+    second = version_dir / "002_second.sql"
+    first.write_text("SELECT 1;")
+    second.write_text("SELECT 2;")
+    migration_service._migrations_dir = Path("migration").resolve()
+
+    initial = await migration_service.scan_migration_directory()
+    assert [m.name for m in initial] == ["001_first", "002_second"]
+
+    second.write_text("SELECT 22;")
+    with patch("builtins.open", wraps=open) as mock_open:
+        rescanned = await migration_service.scan_migration_directory()
+
+    assert rescanned[0] is initial[0]
+    assert rescanned[1].sql_content == "SELECT 22;"
+    assert rescanned[1].checksum == hashlib.md5(b"SELECT 22;").hexdigest()
+    mock_open.assert_called_once()
+
+    first.unlink()
+    assert [m.name for m in await migration_service.scan_migration_directory()] == ["002_second"]
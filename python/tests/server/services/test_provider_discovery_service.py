@@ -0,0 +1,104 @@
+"""
+Unit tests for provider_discovery_service.py
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.server.services.provider_discovery_service import ProviderDiscoveryService
+
+
+@pytest.mark.asyncio
+async def test_get_all_available_models_discovers_providers_concurrently():
+    """Every configured provider is queried at the same time rather than one after another."""
+    service = ProviderDiscoveryService()
+    started = asyncio.Barrier(5)
+
+    def discovery(name):
+        async def discover(*_args):
+            # Only completes once all five discoveries are in flight
+            await asyncio.wait_for(started.wait(), timeout=1)
+            return [name]
+
+        return discover
+
+    for provider in ("openai", "google", "ollama", "anthropic", "grok"):
+        setattr(service, f"discover_{provider}_models", discovery(provider))
+
+    with patch("src.server.services.provider_discovery_service.credential_service") as mock_creds:
+        mock_creds.get_credentials_by_category = AsyncMock(return_value={})
+        mock_creds.get_credential = AsyncMock(return_value="key")
+
+        providers = await service.get_all_available_models()
+
+    assert providers == {
+        "openai": ["openai"],
+        "google": ["google"],
+        "ollama": ["ollama"],
+        "anthropic": ["anthropic"],
+        "grok": ["grok"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_all_available_models_skips_providers_without_keys():
+    service = ProviderDiscoveryService()
+    service.discover_openai_models = AsyncMock(return_value=["gpt"])
+    service.discover_ollama_models = AsyncMock(return_value=["llama"])
+
+    async def get_credential(key):
+        return "key" if key == "OPENAI_API_KEY" else None
+
+    with patch("src.server.services.provider_discovery_service.credential_service") as mock_creds:
+        mock_creds.get_credentials_by_category = AsyncMock(return_value={})
+        mock_creds.get_credential = AsyncMock(side_effect=get_credential)
+
+        providers = await service.get_all_available_models()
+
+    assert providers == {"openai": ["gpt"], "ollama": ["llama"]}
+
+
+@pytest.mark.asyncio
+async def test_discover_ollama_models_probes_tool_support_once_per_model_name():
+    """Tags of one model share a tool-support probe instead of re-testing each tag."""
+    service = ProviderDiscoveryService()
+    service._test_tool_support = AsyncMock(return_value=True)
+
+    response = MagicMock(status=200)
+    response.json = AsyncMock(
+        return_value={"models": [{"name": "llama3:8b"}, {"name": "llama3:70b"}, {"name": "qwen2:7b"}]}
+    )
+    session = MagicMock()
+    session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+    service._get_session = AsyncMock(return_value=session)
+
+    models = await service.discover_ollama_models(["http://ollama:11434"])
+
+    assert [model.name for model in models] == ["llama3:8b", "llama3:70b", "qwen2:7b"]
+    assert all(model.supports_tools for model in models)
+    assert service._test_tool_support.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_available_models_keeps_providers_found_before_credential_error():
+    """A failing key lookup still discovers providers configured before it, without stray coroutines."""
+    service = ProviderDiscoveryService()
+    service.discover_openai_models = AsyncMock(return_value=["gpt"])
+    service.discover_ollama_models = AsyncMock(return_value=["llama"])
+
+    async def get_credential(key):
+        if key == "ANTHROPIC_API_KEY":
+            raise RuntimeError("credential decryption failed")
+        return "key" if key == "OPENAI_API_KEY" else None
+
+    with patch("src.server.services.provider_discovery_service.credential_service") as mock_creds:
+        mock_creds.get_credentials_by_category = AsyncMock(return_value={})
+        mock_creds.get_credential = AsyncMock(side_effect=get_credential)
+
+        providers = await service.get_all_available_models()
+
+    assert providers == {"openai": ["gpt"], "ollama": ["llama"]}
+    service.discover_openai_models.assert_awaited_once_with("key")
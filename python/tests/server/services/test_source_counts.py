@@ -0,0 +1,58 @@
+"""
+Unit tests for source_counts.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.server.services.knowledge.source_counts import get_source_counts
+
+
+def _head_count_client(counts_by_table):
+    client = MagicMock()
+
+    def from_(table):
+        query = MagicMock()
+        query.select.return_value.eq.return_value.execute.return_value = SimpleNamespace(
+            count=counts_by_table[table]
+        )
+        return query
+
+    client.from_.side_effect = from_
+    return client
+
+
+def test_get_source_counts_defaults_missing_sources_to_zero():
+    """Sources absent from the RPC result get zero counts."""
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = SimpleNamespace(
+        data=[{"source_id": "src-1", "document_count": 7, "code_example_count": 2}]
+    )
+
+    doc_counts, code_counts = get_source_counts(client, ["src-1", "src-2"])
+
+    assert doc_counts == {"src-1": 7, "src-2": 0}
+    assert code_counts == {"src-1": 2, "src-2": 0}
+    client.from_.assert_not_called()
+
+
+def test_get_source_counts_falls_back_to_per_source_counts():
+    """Without the RPC (migration 012 not applied) counts come from per-source COUNT queries."""
+    client = _head_count_client({"archon_crawled_pages": 9, "archon_code_examples": 2})
+    client.rpc.return_value.execute.side_effect = Exception("function does not exist")
+
+    doc_counts, code_counts = get_source_counts(client, ["src-1", "src-2"])
+
+    assert doc_counts == {"src-1": 9, "src-2": 9}
+    assert code_counts == {"src-1": 2, "src-2": 2}
+
+
+def test_get_source_counts_fallback_skips_crawled_pages_without_documents():
+    client = _head_count_client({"archon_code_examples": 3})
+    client.rpc.return_value.execute.side_effect = Exception("function does not exist")
+
+    doc_counts, code_counts = get_source_counts(client, ["src-1"], include_documents=False)
+
+    assert doc_counts == {"src-1": 0}
+    assert code_counts == {"src-1": 3}
+    assert [call.args[0] for call in client.from_.call_args_list] == ["archon_code_examples"]
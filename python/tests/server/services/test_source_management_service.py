@@ -0,0 +1,45 @@
+"""
+Unit tests for source_management_service.py
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.server.services.source_management_service import SourceManagementService
+
+
+def test_list_sources_by_type_projects_metadata_fields_in_query():
+    """knowledge_type and tags are extracted server-side instead of fetching full metadata."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    query.contains.return_value = query
+    query.execute.return_value = SimpleNamespace(
+        data=[
+            {
+                "source_id": "src-1",
+                "title": "Docs",
+                "summary": "Summary",
+                "total_word_count": 100,
+                "created_at": "2024-01-01",
+                "updated_at": "2024-01-02",
+                "knowledge_type": "technical",
+                "tags": ["python"],
+            },
+            {"source_id": "src-2", "knowledge_type": None, "tags": None},
+        ]
+    )
+
+    service = SourceManagementService(client)
+    success, result = service.list_sources_by_type("technical")
+
+    assert success is True
+    select_columns = client.table.return_value.select.call_args.args[0]
+    assert "knowledge_type:metadata->>knowledge_type" in select_columns
+    assert "tags:metadata->tags" in select_columns
+    assert "*" not in select_columns
+    query.contains.assert_called_once_with("metadata", {"knowledge_type": "technical"})
+    assert result["sources"][0]["knowledge_type"] == "technical"
+    assert result["sources"][0]["tags"] == ["python"]
+    assert result["sources"][1]["knowledge_type"] == ""
+    assert result["sources"][1]["tags"] == []
+
@@ -6,6 +6,7 @@ These tests verify the core RAG functionality without heavy dependencies.
 """
 
 import os
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -145,6 +146,32 @@ class TestRAGServiceSearch:
             assert isinstance(results, list)
             mock_agentic.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_group_chunks_by_pages_batches_metadata_lookup(self, rag_service, mock_supabase):
+        """Page metadata is fetched with one IN query per key type, not one query per page"""
+        chunks = [
+            {"content": "a", "similarity_score": 0.9, "metadata": {"page_id": "p1", "url": "https://x/1"}},
+            {"content": "b", "similarity_score": 0.7, "metadata": {"page_id": "p1", "url": "https://x/1"}},
+            {"content": "c", "similarity_score": 0.8, "metadata": {"page_id": "p2", "url": "https://x/2"}},
+            {"content": "d", "similarity_score": 0.6, "metadata": {"url": "https://x/3"}},
+        ]
+        in_query = mock_supabase.table.return_value.select.return_value.in_
+        in_query.return_value.execute.side_effect = [
+            SimpleNamespace(data=[
+                {"id": "p1", "url": "https://x/1", "section_title": "One", "word_count": 10},
+                {"id": "p2", "url": "https://x/2", "section_title": "Two", "word_count": 20},
+            ]),
+            SimpleNamespace(data=[{"id": "p3", "url": "https://x/3", "section_title": None, "word_count": 30}]),
+        ]
+
+        results = await rag_service._group_chunks_by_pages(chunks, match_count=5)
+
+        assert in_query.call_args_list[0].args == ("id", ["p1", "p2"])
+        assert in_query.call_args_list[1].args == ("url", ["https://x/3"])
+        assert in_query.call_count == 2
+        assert [r["page_id"] for r in results] == ["p1", "p2", "p3"]
+        assert results[0]["chunk_matches"] == 2
+
 
 class TestHybridSearchCore:
     """Basic hybrid search tests"""